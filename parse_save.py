@@ -1,22 +1,33 @@
 #!/usr/bin/env python3
 
 import struct
-import ctypes
 import argparse
 import sys
 import json
+from functools import wraps
 from pathlib import Path
-from typing import Optional, NamedTuple, Any
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.columns import Columns
-from rich import box
+from typing import Optional, NamedTuple, Any, Callable, TypeVar, Union, TYPE_CHECKING
+
+# rich is only needed by --detailed, so it is imported inside those functions
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# orjson is optional; it serializes the --json output in C. The fallback
+# produces the same compact, non-ASCII-escaped text
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
 
 # Import type definitions and data loading functions
 from poke_types import (
     PlayTimeData, PokemonDictData, SaveData, PokemonStats, MoveData, PokemonMoves,
-    PokemonEVs, PokemonIVs, _data, get_move_name, get_species_name, get_char_map, get_nature_name
+    PokemonEVs, PokemonIVs, _data, get_move_name, get_species_name, get_nature_name,
+    decode_pokemon_string
 )
 
 # Constants
@@ -31,94 +42,175 @@ PARTY_START_OFFSET = 0x6A8
 PARTY_POKEMON_SIZE = 104
 MAX_PARTY_SIZE = 6
 DEFAULT_SAVE_PATH = "./save/player1.sav"
+NUM_NATURES = 25
 
 # Data storage
 _data: dict[str, dict[int, str]] = {}
 
-class SaveBlock2(ctypes.Structure):
-    _pack_ = 1
-    _fields_ = [
-        ("playerName", ctypes.c_uint8 * 8),
-        ("padding_08", ctypes.c_uint8 * 8),
-        ("playTimeHours", ctypes.c_uint32),
-        ("playTimeMinutes", ctypes.c_uint8),
-        ("playTimeSeconds", ctypes.c_uint8),
-    ]
-
-class PokemonData(ctypes.Structure):
-    _pack_ = 1
-    _fields_ = [
-        ("personality", ctypes.c_uint32),
-        ("otId", ctypes.c_uint32),
-        ("nickname", ctypes.c_uint8 * 10),
-        ("unknown_12", ctypes.c_uint8 * 2),
-        ("otName", ctypes.c_uint8 * 7),
-        ("unknown_1B", ctypes.c_uint8 * 8),
-        ("currentHp", ctypes.c_uint16),
-        ("unknown_25", ctypes.c_uint8 * 3),
-        ("speciesId", ctypes.c_uint16),
-        ("item", ctypes.c_uint16),
-        ("unknown_2C", ctypes.c_uint8 * 8),
-        ("move1", ctypes.c_uint16),
-        ("move2", ctypes.c_uint16),
-        ("move3", ctypes.c_uint16),
-        ("move4", ctypes.c_uint16),
-        ("pp1", ctypes.c_uint8),
-        ("pp2", ctypes.c_uint8),
-        ("pp3", ctypes.c_uint8),
-        ("pp4", ctypes.c_uint8),
-        ("hpEV", ctypes.c_uint8),
-        ("atkEV", ctypes.c_uint8),
-        ("defEV", ctypes.c_uint8),
-        ("speEV", ctypes.c_uint8),
-        ("spaEV", ctypes.c_uint8),
-        ("spdEV", ctypes.c_uint8),
-        ("unknown_46", ctypes.c_uint8 * 10),
-        ("ivData", ctypes.c_uint32),
-        ("unknown_54", ctypes.c_uint8 * 4),
-        ("level", ctypes.c_uint8),
-        ("unknown_59", ctypes.c_uint8),
-        ("maxHp", ctypes.c_uint16),
-        ("attack", ctypes.c_uint16),
-        ("defense", ctypes.c_uint16),
-        ("speed", ctypes.c_uint16),
-        ("spAttack", ctypes.c_uint16),
-        ("spDefense", ctypes.c_uint16),
-        ("unknown_66", ctypes.c_uint8 * 2),
-    ]
-    
-    raw_bytes: bytes
-    
+# Party summary layout, shared by the header and every row
+_PARTY_ROW_FMT = "{:<5}{:<8}{:<12}{:<4}{:<10}{:<30} {:<5}{:<5}{:<5}{:<5}{:<5}{:<10}{:<7}"
+HP_BAR_WIDTH = 20
+_HP_BARS: tuple[str, ...] = tuple("█" * i + "░" * (HP_BAR_WIDTH - i) for i in range(HP_BAR_WIDTH + 1))
+
+# Sector data as little-endian words, summed for the sector checksum
+_SECTOR_WORDS = SECTOR_DATA_SIZE // 4
+_CHECKSUM_STRUCT = struct.Struct(f"<{_SECTOR_WORDS}I")
+# A whole sector with only its footer unpacked
+_SECTOR_STRUCT = struct.Struct(f"<{SECTOR_SIZE - SECTOR_FOOTER_SIZE}xHHII")
+
+def _fold_checksum(word_sum: int) -> int:
+    return ((word_sum >> 16) + (word_sum & 0xFFFF)) & 0xFFFF
+
+# SaveBlock2 header: playerName[8], 8 bytes padding, playTimeHours (u32),
+# playTimeMinutes (u8), playTimeSeconds (u8)
+_SAVEBLOCK2_STRUCT = struct.Struct("<8s8xIBB")
+
+# PokemonData layout as (field name, struct format) pairs, 104 bytes in total
+_POKEMON_LAYOUT: tuple[tuple[str, str], ...] = (
+    ("personality", "I"),
+    ("otId", "I"),
+    ("nickname", "10s"),
+    ("unknown_12", "2s"),
+    ("otName", "7s"),
+    ("unknown_1B", "8s"),
+    ("currentHp", "H"),
+    ("unknown_25", "3s"),
+    ("speciesId", "H"),
+    ("item", "H"),
+    ("unknown_2C", "8s"),
+    ("move1", "H"),
+    ("move2", "H"),
+    ("move3", "H"),
+    ("move4", "H"),
+    ("pp1", "B"),
+    ("pp2", "B"),
+    ("pp3", "B"),
+    ("pp4", "B"),
+    ("hpEV", "B"),
+    ("atkEV", "B"),
+    ("defEV", "B"),
+    ("speEV", "B"),
+    ("spaEV", "B"),
+    ("spdEV", "B"),
+    ("unknown_46", "10s"),
+    ("ivData", "I"),
+    ("unknown_54", "4s"),
+    ("level", "B"),
+    ("unknown_59", "B"),
+    ("maxHp", "H"),
+    ("attack", "H"),
+    ("defense", "H"),
+    ("speed", "H"),
+    ("spAttack", "H"),
+    ("spDefense", "H"),
+    ("unknown_66", "2s"),
+)
+_POKEMON_STRUCT = struct.Struct("<" + "".join(field_format for _, field_format in _POKEMON_LAYOUT))
+_POKEMON_FIELD_NAMES = tuple(field_name for field_name, _ in _POKEMON_LAYOUT)
+_POKEMON_ARRAY_FIELDS = tuple(
+    field_name for field_name, field_format in _POKEMON_LAYOUT
+    if field_format.endswith("s") and field_name not in ("nickname", "otName")
+)
+
+_T = TypeVar("_T")
+
+# functools.cached_property needs an instance __dict__, which slotted
+# PokemonData does not have, so results live in its _cache dict instead
+def _cached_property(func: Callable[['PokemonData'], _T]) -> property:
+    name = func.__name__
+
+    @wraps(func)
+    def getter(self: 'PokemonData') -> _T:
+        cache = self._cache
+        if name not in cache:
+            cache[name] = func(self)
+        return cache[name]
+    return property(getter)
+
+class PokemonData:
+    __slots__ = _POKEMON_FIELD_NAMES + ("_values", "_buffer", "_offset", "_cache")
+
+    personality: int
+    otId: int
+    nickname: bytes
+    unknown_12: bytes
+    otName: bytes
+    unknown_1B: bytes
+    currentHp: int
+    unknown_25: bytes
+    speciesId: int
+    item: int
+    unknown_2C: bytes
+    move1: int
+    move2: int
+    move3: int
+    move4: int
+    pp1: int
+    pp2: int
+    pp3: int
+    pp4: int
+    hpEV: int
+    atkEV: int
+    defEV: int
+    speEV: int
+    spaEV: int
+    spdEV: int
+    unknown_46: bytes
+    ivData: int
+    unknown_54: bytes
+    level: int
+    unknown_59: int
+    maxHp: int
+    attack: int
+    defense: int
+    speed: int
+    spAttack: int
+    spDefense: int
+    unknown_66: bytes
+
+    def __init__(self, values: tuple[Any, ...], buffer: bytes, offset: int) -> None:
+        for field_name, value in zip(_POKEMON_FIELD_NAMES, values):
+            setattr(self, field_name, value)
+        # The unpacked record in layout order, reused by pokemon_to_dict
+        self._values = values
+        self._buffer = buffer
+        self._offset = offset
+        self._cache: dict[str, Any] = {}
+
     @property
+    def raw_bytes(self) -> memoryview:
+        return memoryview(self._buffer)[self._offset:self._offset + PARTY_POKEMON_SIZE]
+    
+    @_cached_property
     def nature_str(self) -> str:
-        return get_nature_name((self.personality & 0xFF) % 25)
+        return get_nature_name((self.personality & 0xFF) % NUM_NATURES)
     
-    @property
+    @_cached_property
     def otName_str(self) -> str:
-        return PokemonSaveParser.decode_pokemon_string(bytes(self.otName))
+        return PokemonSaveParser.decode_pokemon_string(self.otName)
 
     @property
     def otId_str(self) -> str:
         return f"{self.otId & 0xFFFF:05}"
     
-    @property
+    @_cached_property
     def nickname_str(self) -> str:
-        return PokemonSaveParser.decode_pokemon_string(bytes(self.nickname))
+        return PokemonSaveParser.decode_pokemon_string(self.nickname)
 
-    @property
+    @_cached_property
     def species_name(self) -> str:
         return get_species_name(self.speciesId)
     
-    @property
+    @_cached_property
     def moves_data(self) -> PokemonMoves:
         return PokemonMoves.from_raw_data(
             move1_id=self.move1, move2_id=self.move2, move3_id=self.move3, move4_id=self.move4,
             pp1=self.pp1, pp2=self.pp2, pp3=self.pp3, pp4=self.pp4
         )
     
-    @property
-    def evs(self) -> list[int]:
-        return [self.hpEV, self.atkEV, self.defEV, self.speEV, self.spaEV, self.spdEV]
+    @_cached_property
+    def evs(self) -> tuple[int, ...]:
+        return (self.hpEV, self.atkEV, self.defEV, self.speEV, self.spaEV, self.spdEV)
     
     @property
     def evs_structured(self) -> PokemonEVs:
@@ -127,10 +219,11 @@ class PokemonData(ctypes.Structure):
             speed=self.speEV, sp_attack=self.spaEV, sp_defense=self.spdEV
         )
     
-    @property
-    def ivs(self) -> list[int]:
+    @_cached_property
+    def ivs(self) -> tuple[int, ...]:
         iv = self.ivData
-        return [(iv >> (i * 5)) & 0x1F for i in range(6)]
+        return (iv & 0x1F, (iv >> 5) & 0x1F, (iv >> 10) & 0x1F,
+                (iv >> 15) & 0x1F, (iv >> 20) & 0x1F, (iv >> 25) & 0x1F)
     
     @property
     def ivs_structured(self) -> PokemonIVs:
@@ -163,6 +256,8 @@ class PokemonSaveParser:
         self.active_slot_start: int = 0
         self.sector_map: dict[int, int] = {}
         self.forced_slot = forced_slot
+        self._sector_cache: dict[int, SectorInfo] = {}
+        self._mv = memoryview(b"")
 
     def load_save_file(self) -> None:
         if not self.save_path.exists():
@@ -172,54 +267,45 @@ class PokemonSaveParser:
                 self.save_data = f.read()
         except IOError as e:
             raise IOError(f"Failed to read save file: {e}")
+        # Zero-copy window over the save; slices of it never allocate new bytes
+        self._mv = memoryview(self.save_data)
+        self._compute_all_sector_info()
 
     @staticmethod
     def decode_pokemon_string(encoded_bytes: bytes) -> str:
-        result = ""
-        char_map = get_char_map()
-        for byte in encoded_bytes:
-            if byte == 0xFF:
-                break
-            result += char_map.get(byte, "?")
-        return result
+        return decode_pokemon_string(bytes(encoded_bytes))
 
     def get_sector_info(self, sector_index: int) -> SectorInfo:
+        sector_info = self._sector_cache.get(sector_index)
+        if sector_info is not None:
+            return sector_info
         if not self.save_data:
             raise ValueError("Save data not loaded")
-        
-        footer_offset = (sector_index * SECTOR_SIZE) + SECTOR_SIZE - SECTOR_FOOTER_SIZE
-        
-        if footer_offset + SECTOR_FOOTER_SIZE > len(self.save_data):
-            return SectorInfo(-1, 0, 0, False)
-            
-        try:
-            sector_id, checksum, signature, counter = struct.unpack(
-                "<HHII",
-                self.save_data[footer_offset:footer_offset + SECTOR_FOOTER_SIZE]
-            )
-            
-            if signature != EMERALD_SIGNATURE:
-                return SectorInfo(sector_id, checksum, counter, False)
-            
-            sector_start = sector_index * SECTOR_SIZE
-            sector_data = self.save_data[sector_start:sector_start + SECTOR_DATA_SIZE]
-            
-            calculated_checksum = self.calculate_sector_checksum(sector_data)
-            valid = (calculated_checksum == checksum)
-            
-            return SectorInfo(sector_id, checksum, counter, valid)
-        except (struct.error, IndexError):
-            return SectorInfo(-1, 0, 0, False)
+        # Every whole sector is cached on load, so this one lies past the end of the file
+        return SectorInfo(-1, 0, 0, False)
+
+    def _compute_all_sector_info(self) -> None:
+        # One iter_unpack pass yields the footer of every whole sector; the data
+        # words are only summed for sectors whose signature matches
+        self._sector_cache = {}
+        sector_count = min(len(self.save_data) // SECTOR_SIZE, TOTAL_SECTORS)
+        footers = _SECTOR_STRUCT.iter_unpack(self._mv[:sector_count * SECTOR_SIZE])
+        for sector_index, (sector_id, checksum, signature, counter) in enumerate(footers):
+            valid = False
+            if signature == EMERALD_SIGNATURE:
+                offset = sector_index * SECTOR_SIZE
+                valid = self.calculate_sector_checksum(self._mv[offset:offset + SECTOR_DATA_SIZE]) == checksum
+            self._sector_cache[sector_index] = SectorInfo(sector_id, checksum, counter, valid)
 
     def determine_active_slot(self) -> None:
         if self.forced_slot is not None:
             self.active_slot_start = 0 if self.forced_slot == 1 else 14
             return
         
-        slot1_counter = max((self.get_sector_info(i).counter for i in range(18) 
-                            if self.get_sector_info(i).valid), default=0)
-        slot2_counter = max((self.get_sector_info(i).counter for i in range(14, 32) 
-                            if self.get_sector_info(i).valid), default=0)
+        slot1_counter = max((sector_info.counter for i in range(18)
+                            if (sector_info := self.get_sector_info(i)).valid), default=0)
+        slot2_counter = max((sector_info.counter for i in range(14, 32)
+                            if (sector_info := self.get_sector_info(i)).valid), default=0)
         
         self.active_slot_start = 14 if slot2_counter >= slot1_counter else 0
 
@@ -247,17 +333,16 @@ class PokemonSaveParser:
         print(f"\nActive slot: {active_slot} (highest counter wins, slot 2 wins ties)")
 
     def build_sector_map(self) -> None:
-        self.sector_map = {}
-        
         if self.forced_slot is not None:
             sector_range = range(18) if self.forced_slot == 1 else range(14, 32)
         else:
             sector_range = range(self.active_slot_start, self.active_slot_start + 18)
         
-        for i in sector_range:
-            sector_info = self.get_sector_info(i)
-            if sector_info.valid:
-                self.sector_map[sector_info.id] = i
+        self.sector_map = {
+            sector_info.id: i
+            for i in sector_range
+            if (sector_info := self.get_sector_info(i)).valid
+        }
 
     def extract_saveblock1(self) -> bytearray:
         if not self.save_data:
@@ -268,52 +353,43 @@ class PokemonSaveParser:
             raise ValueError("No SaveBlock1 sectors found")
         
         saveblock1_data = bytearray(SAVEBLOCK1_SIZE)
-        for sector_id in saveblock1_sectors:
-            sector_idx = self.sector_map[sector_id]
-            start_offset = sector_idx * SECTOR_SIZE
-            sector_data = self.save_data[start_offset:start_offset + SECTOR_DATA_SIZE]
-            chunk_offset = (sector_id - 1) * SECTOR_DATA_SIZE
-            saveblock1_data[chunk_offset:chunk_offset + SECTOR_DATA_SIZE] = sector_data[:SECTOR_DATA_SIZE]
+        # memoryview-to-memoryview assignment copies once, with no temporary bytes
+        with memoryview(saveblock1_data) as dst:
+            for sector_id in saveblock1_sectors:
+                sector_idx = self.sector_map[sector_id]
+                start_offset = sector_idx * SECTOR_SIZE
+                chunk_offset = (sector_id - 1) * SECTOR_DATA_SIZE
+                dst[chunk_offset:chunk_offset + SECTOR_DATA_SIZE] = self._mv[start_offset:start_offset + SECTOR_DATA_SIZE]
         return saveblock1_data
 
-    def extract_saveblock2(self) -> bytes:
+    def extract_saveblock2(self) -> memoryview:
         if not self.save_data:
             raise ValueError("Save data not loaded")
         if 0 not in self.sector_map:
             raise ValueError("SaveBlock2 sector (ID 0) not found")
         sector_idx = self.sector_map[0]
         start_offset = sector_idx * SECTOR_SIZE
-        saveblock2_data = self.save_data[start_offset:start_offset + SECTOR_DATA_SIZE]
+        saveblock2_data = self._mv[start_offset:start_offset + SECTOR_DATA_SIZE]
         return saveblock2_data
 
     def parse_party_pokemon(self, saveblock1_data: bytes) -> list[PokemonData]:
+        party_data = memoryview(saveblock1_data)[PARTY_START_OFFSET:PARTY_START_OFFSET + MAX_PARTY_SIZE * PARTY_POKEMON_SIZE]
+        party_data = party_data[:len(party_data) - len(party_data) % PARTY_POKEMON_SIZE]
+        
         party_pokemon = []
-        for slot in range(MAX_PARTY_SIZE):
-            offset = PARTY_START_OFFSET + slot * PARTY_POKEMON_SIZE
-            data = saveblock1_data[offset:offset + PARTY_POKEMON_SIZE]
-            
-            if len(data) < ctypes.sizeof(PokemonData):
-                break
-                
-            pokemon = PokemonData.from_buffer_copy(data[:ctypes.sizeof(PokemonData)])
+        for slot, values in enumerate(_POKEMON_STRUCT.iter_unpack(party_data)):
+            pokemon = PokemonData(values, saveblock1_data, PARTY_START_OFFSET + slot * PARTY_POKEMON_SIZE)
             if pokemon.speciesId == 0:
                 break
                 
-            pokemon.raw_bytes = data
             party_pokemon.append(pokemon)
         return party_pokemon
 
-    def parse_player_name(self, saveblock2_data: bytes) -> str:
-        saveblock2 = SaveBlock2.from_buffer_copy(saveblock2_data)
-        return PokemonSaveParser.decode_pokemon_string(bytes(saveblock2.playerName))
-
-    def parse_play_time(self, saveblock2_data: bytes) -> PlayTimeData:
-        saveblock2 = SaveBlock2.from_buffer_copy(saveblock2_data)
-        return PlayTimeData(
-            hours=saveblock2.playTimeHours,
-            minutes=saveblock2.playTimeMinutes,
-            seconds=saveblock2.playTimeSeconds
-        )
+    def parse_saveblock2(self, saveblock2_data: Union[bytes, memoryview]) -> tuple[str, PlayTimeData]:
+        name_bytes, hours, minutes, seconds = _SAVEBLOCK2_STRUCT.unpack_from(saveblock2_data)
+        player_name = PokemonSaveParser.decode_pokemon_string(name_bytes)
+        play_time = PlayTimeData(hours=hours, minutes=minutes, seconds=seconds)
+        return player_name, play_time
 
     def parse_save_file(self) -> SaveData:
         self.load_save_file()
@@ -321,9 +397,8 @@ class PokemonSaveParser:
         self.build_sector_map()
         saveblock1_data = self.extract_saveblock1()
         saveblock2_data = self.extract_saveblock2()
-        player_name = self.parse_player_name(saveblock2_data)
+        player_name, play_time = self.parse_saveblock2(saveblock2_data)
         party_pokemon = self.parse_party_pokemon(saveblock1_data)
-        play_time = self.parse_play_time(saveblock2_data)
         return SaveData(
             party_pokemon=party_pokemon,
             player_name=player_name,
@@ -339,18 +414,21 @@ class PokemonSaveParser:
             print("No Pokémon found in party.")
             return
         
-        header = f"{'Slot':<5}{'Dex ID':<8}{'Nickname':<12}{'Lv':<4}{'Nature':<10}{'HP':<30} {'Atk':<5}{'Def':<5}{'Spe':<5}{'SpA':<5}{'SpD':<5}{'OT Name':<10}{'IDNo':<7}"
-        print(header)
-        print("-" * len(header))
+        header = _PARTY_ROW_FMT.format("Slot", "Dex ID", "Nickname", "Lv", "Nature", "HP",
+                                       "Atk", "Def", "Spe", "SpA", "SpD", "OT Name", "IDNo")
+        lines = [header, "-" * len(header)]
         
         for slot, pokemon in enumerate(party_pokemon, 1):
-            hp_bars = int(20 * pokemon.currentHp / pokemon.maxHp) if pokemon.maxHp > 0 else 0
-            hp_display = f"[{'█' * hp_bars}{'░' * (20 - hp_bars)}] {pokemon.currentHp}/{pokemon.maxHp}"
+            hp_bars = min(int(HP_BAR_WIDTH * pokemon.currentHp / pokemon.maxHp), HP_BAR_WIDTH) if pokemon.maxHp > 0 else 0
+            hp_display = f"[{_HP_BARS[hp_bars]}] {pokemon.currentHp}/{pokemon.maxHp}"
             
-            print(f"{slot:<5}{pokemon.speciesId:<8}{pokemon.nickname_str:<12}{pokemon.level:<4}"
-                  f"{pokemon.nature_str:<10}{hp_display:<30} {pokemon.attack:<5}{pokemon.defense:<5}"
-                  f"{pokemon.speed:<5}{pokemon.spAttack:<5}{pokemon.spDefense:<5}"
-                  f"{pokemon.otName_str:<10}{pokemon.otId_str:<7}")
+            lines.append(_PARTY_ROW_FMT.format(
+                slot, pokemon.speciesId, pokemon.nickname_str, pokemon.level,
+                pokemon.nature_str, hp_display, pokemon.attack, pokemon.defense,
+                pokemon.speed, pokemon.spAttack, pokemon.spDefense,
+                pokemon.otName_str, pokemon.otId_str
+            ))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def display_saveblock2_info(save_data: SaveData) -> None:
@@ -372,31 +450,29 @@ class PokemonSaveParser:
         if not party_pokemon:
             print("No Pokémon found in party.")
             return
+        lines = []
         for slot, pokemon in enumerate(party_pokemon, 1):
-            print(f"\n--- Slot {slot}: {pokemon.nickname_str} ---")
-            print(' '.join(f'{b:02x}' for b in pokemon.raw_bytes))
+            lines.append(f"\n--- Slot {slot}: {pokemon.nickname_str} ---")
+            lines.append(pokemon.raw_bytes.hex(' '))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def pokemon_to_dict(pokemon: PokemonData) -> dict[str, Any]:
-        data: dict[str, Any] = {}
-        for field_info in pokemon._fields_:
-            field_name = field_info[0]
-            value = getattr(pokemon, field_name)
-            if field_name in ["nickname", "otName"]:
-                data[field_name] = PokemonSaveParser.decode_pokemon_string(bytes(value))
-            elif isinstance(value, ctypes.Array):
-                data[field_name] = list(value)  # type: ignore
-            else:
-                data[field_name] = int(value) if hasattr(value, '__int__') else value
-                
+        data: dict[str, Any] = dict(zip(_POKEMON_FIELD_NAMES, pokemon._values))
+        data['nickname'] = pokemon.nickname_str
+        data['otName'] = pokemon.otName_str
+        for field_name in _POKEMON_ARRAY_FIELDS:
+            data[field_name] = list(data[field_name])
+
+        moves, evs, ivs = pokemon.moves_data, pokemon.evs, pokemon.ivs
         data.update({
             'displayOtId': pokemon.otId_str,
             'displayNature': pokemon.nature_str,
-            'moves': pokemon.moves_data.to_dict(),
-            'evs': pokemon.evs,
-            'ivs': pokemon.ivs,
-            'totalEvs': sum(pokemon.evs),
-            'totalIvs': sum(pokemon.ivs)
+            'moves': moves.to_dict(),
+            'evs': list(evs),
+            'ivs': list(ivs),
+            'totalEvs': sum(evs),
+            'totalIvs': sum(ivs)
         })
         return data
 
@@ -410,10 +486,13 @@ class PokemonSaveParser:
             'sector_map': save_data['sector_map'],
             'party_pokemon': party_data
         }
-        print(json.dumps(output))
+        sys.stdout.write(_json_dumps(output) + "\n")
 
     @staticmethod
-    def _create_basic_info_table(pokemon: PokemonData) -> Table:
+    def _create_basic_info_table(pokemon: PokemonData) -> 'Table':
+        from rich.table import Table
+        from rich import box
+
         info_table = Table(show_header=False, box=box.SIMPLE, pad_edge=False)
         info_table.add_column("Field", style="cyan", width=12)
         info_table.add_column("Value", style="white")
@@ -429,15 +508,16 @@ class PokemonSaveParser:
         return info_table
 
     @staticmethod
-    def _create_stats_table(pokemon: PokemonData) -> Table:
+    def _create_stats_table(pokemon: PokemonData, ivs: tuple[int, ...], evs: tuple[int, ...]) -> 'Table':
+        from rich.table import Table
+        from rich import box
+
         stats_table = Table(title="[cyan]Base Stats[/cyan]", box=box.ROUNDED, width=35)
         stats_table.add_column("Stat", style="cyan", width=8)
         stats_table.add_column("Value", justify="right", style="yellow", width=6)
         stats_table.add_column("EV", justify="right", style="green", width=4)
         stats_table.add_column("IV", justify="right", style="bright_blue", width=4)
         
-        evs = pokemon.evs
-        ivs = pokemon.ivs
         stats_table.add_row("HP", f"{pokemon.maxHp}", f"{evs[0]}", f"{ivs[0]}")
         stats_table.add_row("Attack", f"{pokemon.attack}", f"{evs[1]}", f"{ivs[1]}")
         stats_table.add_row("Defense", f"{pokemon.defense}", f"{evs[2]}", f"{ivs[2]}")
@@ -447,13 +527,16 @@ class PokemonSaveParser:
         return stats_table
 
     @staticmethod
-    def _create_moves_table(pokemon: PokemonData) -> Table:
+    def _create_moves_table(moves: PokemonMoves) -> 'Table':
+        from rich.table import Table
+        from rich import box
+
         moves_table = Table(title="[green]Moves[/green]", box=box.ROUNDED, width=45)
         moves_table.add_column("#", width=2)
         moves_table.add_column("Move", style="green")
         moves_table.add_column("PP", justify="center", style="yellow", width=4)
         
-        for i, (move_name, pp) in enumerate(zip(pokemon.moves_data.get_move_names(), pokemon.moves_data.get_pp_values()), 1):
+        for i, (move_name, pp) in enumerate(zip(moves.get_move_names(), moves.get_pp_values()), 1):
             if move_name != "---":
                 moves_table.add_row(f"{i}", move_name, f"{pp}")
             else:
@@ -461,9 +544,10 @@ class PokemonSaveParser:
         return moves_table
 
     @staticmethod
-    def _create_summary_table(pokemon: PokemonData) -> Table:
-        evs = pokemon.evs
-        ivs = pokemon.ivs
+    def _create_summary_table(ivs: tuple[int, ...], evs: tuple[int, ...]) -> 'Table':
+        from rich.table import Table
+        from rich import box
+
         ev_total = sum(evs)
         iv_total = sum(ivs)
         ev_color = "green" if ev_total <= 510 else "red"
@@ -478,6 +562,11 @@ class PokemonSaveParser:
 
     @staticmethod
     def display_party_pokemon_detailed(party_pokemon: list[PokemonData]) -> None:
+        from rich.console import Console
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich.columns import Columns
+
         console = Console()
         
         if not party_pokemon:
@@ -487,10 +576,11 @@ class PokemonSaveParser:
         console.print(Panel.fit("🎮 POKÉMON PARTY SUMMARY 🎮", style="bold magenta"))
         
         for slot, pokemon in enumerate(party_pokemon, 1):
+            ivs, evs = pokemon.ivs, pokemon.evs
             info_table = PokemonSaveParser._create_basic_info_table(pokemon)
-            stats_table = PokemonSaveParser._create_stats_table(pokemon)
-            moves_table = PokemonSaveParser._create_moves_table(pokemon)
-            summary_table = PokemonSaveParser._create_summary_table(pokemon)
+            stats_table = PokemonSaveParser._create_stats_table(pokemon, ivs, evs)
+            moves_table = PokemonSaveParser._create_moves_table(pokemon.moves_data)
+            summary_table = PokemonSaveParser._create_summary_table(ivs, evs)
             
             left_panel = Panel(info_table, title="[bold]Basic Info[/bold]", border_style="blue")
             right_content = Table.grid()
@@ -511,17 +601,11 @@ class PokemonSaveParser:
             console.print(pokemon_panel)
             console.print()
 
-    def calculate_sector_checksum(self, sector_data: bytes) -> int:
+    def calculate_sector_checksum(self, sector_data: Union[bytes, memoryview]) -> int:
         if len(sector_data) < SECTOR_DATA_SIZE:
             return 0
             
-        checksum = 0
-        for i in range(0, SECTOR_DATA_SIZE, 4):
-            if i + 4 <= len(sector_data):
-                value = struct.unpack("<I", sector_data[i:i+4])[0]
-                checksum += value
-        
-        return ((checksum >> 16) + (checksum & 0xFFFF)) & 0xFFFF
+        return _fold_checksum(sum(_CHECKSUM_STRUCT.unpack_from(sector_data)))
 
 def main() -> None:
     if hasattr(sys.stdout, 'reconfigure'):
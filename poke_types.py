@@ -1,7 +1,16 @@
 import json
-from typing import TypedDict, Any
+import sys
+from functools import lru_cache
+from typing import TypedDict, Any, Optional
 from dataclasses import dataclass
 
+# orjson is optional; it parses the lookup tables several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Data storage
 _data: dict[str, dict[int, str]] = {}
 
@@ -139,31 +148,78 @@ class PokemonIVs:
     def total(self) -> int:
         return sum(self.to_list())
 
-def _load_data() -> None:
-    files = {
-        "pokemon_moves.json": "moves",
-        "pokemon_species.json": "species", 
-        "pokemon_charmap.json": "chars",
-        "pokemon_natures.json": "natures"
-    }
-    
-    for filename, key in files.items():
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                _data[key] = {int(k): v for k, v in json.load(f).items()}
-        except (FileNotFoundError, json.JSONDecodeError):
-            _data[key] = {}
+_DATA_FILES = {
+    "moves": "pokemon_moves.json",
+    "species": "pokemon_species.json",
+    "chars": "pokemon_charmap.json",
+    "natures": "pokemon_natures.json"
+}
+
+def _ensure_loaded(key: str) -> dict[int, str]:
+    try:
+        return _data[key]
+    except KeyError:
+        pass
+    try:
+        with open(_DATA_FILES[key], 'rb') as f:
+            raw = _json_loads(f.read())
+        table = dict(zip(map(int, raw), map(sys.intern, raw.values())))
+    except (FileNotFoundError, json.JSONDecodeError):
+        table = {}
+    _data[key] = table
+    return table
 
-_load_data()
+# Move, species and nature IDs are small and mostly contiguous, so the
+# tables are also kept as lists indexed by ID with None for the gaps
+@lru_cache(maxsize=None)
+def _name_list(key: str) -> list[Optional[str]]:
+    table = _ensure_loaded(key)
+    names: list[Optional[str]] = [None] * (max(table, default=-1) + 1)
+    for id_, name in table.items():
+        if id_ >= 0:
+            names[id_] = name
+    return names
 
+# The fallback names are only formatted on a miss rather than passed as a
+# default, which would build the string on every lookup
 def get_move_name(move_id: int) -> str:
-    return _data.get("moves", {}).get(move_id, f"Move {move_id}")
+    names = _name_list("moves")
+    name = names[move_id] if 0 <= move_id < len(names) else None
+    return name if name is not None else f"Move {move_id}"
 
 def get_species_name(species_id: int) -> str:
-    return _data.get("species", {}).get(species_id, f"Species {species_id}")
+    names = _name_list("species")
+    name = names[species_id] if 0 <= species_id < len(names) else None
+    return name if name is not None else f"Species {species_id}"
 
 def get_char_map() -> dict[int, str]:
-    return _data.get("chars", {})
+    return _ensure_loaded("chars")
 
 def get_nature_name(nature_id: int) -> str:
-    return _data.get("natures", {}).get(nature_id, f"Nature {nature_id}")
+    names = _name_list("natures")
+    name = names[nature_id] if 0 <= nature_id < len(names) else None
+    return name if name is not None else f"Nature {nature_id}"
+
+@lru_cache(maxsize=None)
+def _char_tables() -> tuple[bytes, frozenset[int], list[str]]:
+    char_map = get_char_map()
+    # Bytes that decode to a single ASCII character go through bytes.translate;
+    # anything else (multi-char tokens, non-ASCII glyphs) needs the full table
+    ascii_trans = bytes(
+        ord(char) if len(char) == 1 and char.isascii() else ord("?")
+        for char in (char_map.get(i, "?") for i in range(256))
+    )
+    complex_chars = frozenset(
+        byte for byte, char in char_map.items() if len(char) != 1 or not char.isascii()
+    )
+    # Indexed by code point for str.translate over latin-1 decoded bytes
+    char_lut = [char_map.get(i, "?") for i in range(256)]
+    return ascii_trans, complex_chars, char_lut
+
+@lru_cache(maxsize=512)
+def decode_pokemon_string(encoded_bytes: bytes) -> str:
+    ascii_trans, complex_chars, char_lut = _char_tables()
+    encoded_bytes = encoded_bytes.split(b"\xff", 1)[0]
+    if complex_chars.isdisjoint(encoded_bytes):
+        return encoded_bytes.translate(ascii_trans).decode("ascii")
+    return encoded_bytes.decode("latin-1").translate(char_lut)
@@ -6,8 +6,101 @@ Extracts moves, species, and other data from C header files
 
 import re
 import json
+import mmap
+import hashlib
+import contextlib
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# orjson is optional; it writes the same JSON several times faster
+try:
+    import orjson
+
+    def _dump_json(data: Any, indent: bool) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+except ImportError:
+    def _dump_json(data: Any, indent: bool) -> bytes:
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Parsed header maps are stored here as JSON and reused while neither the header nor
+# this parser has changed since
+_CACHE_DIR = Path.home() / ".cache" / "pokeparser"
+_PARSER_MTIME = Path(__file__).stat().st_mtime_ns
+
+# Matches both "#define MOVE_NAME number" and "#define SPECIES_NAME number"
+# against the raw header bytes, so one compiled pattern serves both parsers.
+# SPECIES_NONE is rejected inside the regex engine rather than in Python
+_DEFINE_RE = re.compile(rb'#define\s+(MOVE|SPECIES(?!_NONE\b))_(\w+)\s+(\d+)')
+
+# Special-case fixups applied to the title-cased names in a single pass
+_MOVE_FIXUPS = {'Hp': 'HP', 'Pp': 'PP', 'U Turn': 'U-turn', 'V Create': 'V-create'}
+_MOVE_FIXUP_RE = re.compile('|'.join(map(re.escape, _MOVE_FIXUPS)))
+_SPECIES_FIXUPS = {
+    ' F': '♀',  # Female symbol
+    ' M': '♂',  # Male symbol
+    'Ho Oh': 'Ho-Oh',
+    'Mime Jr': 'Mime Jr.',
+}
+_SPECIES_FIXUP_RE = re.compile('|'.join(map(re.escape, _SPECIES_FIXUPS)))
+
+def _format_move_name(move_name: bytes) -> str:
+    # Convert MOVE_NAME to "Move Name", then handle special cases
+    formatted_name = move_name.replace(b'_', b' ').title().decode('ascii')
+    return _MOVE_FIXUP_RE.sub(lambda m: _MOVE_FIXUPS[m.group()], formatted_name)
+
+def _format_species_name(species_name: bytes) -> str:
+    # Convert SPECIES_NAME to "Species Name", then handle special cases
+    formatted_name = species_name.replace(b'_', b' ').title().decode('ascii')
+    return _SPECIES_FIXUP_RE.sub(lambda m: _SPECIES_FIXUPS[m.group()], formatted_name)
+
+# Special charmap tokens mapped to readable strings; other tokens are skipped
+_CHARMAP_TOKENS = {b"PK": "poke", b"PKMN": "POKE", b"LV": "[", b"NBSP": " "}
+# Two-digit hex values (in any letter case), the form charmap.txt uses, mapped
+# to byte values so they skip int(); anything else still goes through int()
+_HEX_BYTE_VALUES = {
+    bytes((hi, lo)): int(chr(hi) + chr(lo), 16)
+    for hi in b"0123456789abcdefABCDEF" for lo in b"0123456789abcdefABCDEF"
+}
+# One charmap.txt line per match, either 'A' = BB (first of possibly several
+# hex values) or a special token with a single hex value, e.g. PK = 53
+_CHARMAP_LINE_RE = re.compile(
+    rb"(?m)^[^\S\n]*(?:'([^=\n]+)'[^\S\n]*=[^\S\n]*(?=\S)|"
+    rb"(" + b"|".join(_CHARMAP_TOKENS) + rb")[^\S\n]*=[^\S\n]*(?=\S+[^\S\n]*$))(\S+)"
+)
+
+# Standard Pokemon nature order, indexed by nature ID
+_NATURES = (
+    "Hardy", "Lonely", "Brave", "Adamant", "Naughty",
+    "Bold", "Docile", "Relaxed", "Impish", "Lax",
+    "Timid", "Hasty", "Serious", "Jolly", "Naive",
+    "Modest", "Mild", "Quiet", "Bashful", "Rash",
+    "Calm", "Gentle", "Sassy", "Careful", "Quirky",
+)
+
+# Returned by the parse_* methods when their input file is missing
+_EMPTY_MAP: Mapping[int, str] = MappingProxyType({})
+
+def _dense_table(mapping: Mapping[int, str], size: int = 0,
+                 fill: Optional[str] = None) -> List[Optional[str]]:
+    """Lay out an ID-keyed map as a list indexed by ID, with fill for the gaps"""
+    table: List[Optional[str]] = [fill] * max(size, max(mapping, default=-1) + 1)
+    for key, value in mapping.items():
+        if key >= 0:
+            table[key] = value
+    return table
+
+@dataclass
+class ParsedData:
+    moves: Mapping[int, str]
+    species: Mapping[int, str]
+    char_map: Mapping[int, str]
+    natures: Mapping[int, str]
 
 class PokemonDataParser:
     def __init__(self, project_root: str = "."):
@@ -17,125 +110,98 @@ class PokemonDataParser:
         self.char_map_data: Dict[int, str] = {}
         self.natures_data: Dict[int, str] = {}
         
-    def parse_moves(self) -> Dict[int, str]:
-        """Parse moves from constants/moves.h"""
-        moves_file = self.project_root / "include/constants/moves.h"
-        moves_map = {}
-        
-        if not moves_file.exists():
-            print(f"Warning: {moves_file} not found")
-            return moves_map
+    def _parse_header(self, relative_path: str, kind: bytes,
+                      build_map: Callable[[Iterator[Tuple[bytes, bytes]]], Dict[int, str]]) -> Optional[Dict[int, str]]:
+        """Build a map from the #defines of one kind in a header, using the disk cache when valid"""
+        header_file = self.project_root / relative_path
+        try:
+            header_stat = header_file.stat()
+        except FileNotFoundError:
+            print(f"Warning: {header_file} not found")
+            return None
+            
+        resolved = str(header_file.resolve())
+        cache_key = [resolved, header_stat.st_mtime_ns, header_stat.st_size, _PARSER_MTIME]
+        # The path hash keeps the caches of separate checkouts apart
+        path_hash = hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:12]
+        cache_file = _CACHE_DIR / f"{kind.decode('ascii').lower()}-{path_hash}.json"
+        # Any unreadable or malformed cache entry just falls back to parsing
+        try:
+            cached = json.loads(cache_file.read_bytes())
+            if (isinstance(cached, dict) and cached.get("key") == cache_key
+                    and isinstance(cached.get("map"), dict)):
+                return {int(k): v for k, v in cached["map"].items()}
+        except (OSError, ValueError):
+            pass
             
-        with open(moves_file, 'r', encoding='utf-8') as f:
+        with open(header_file, 'rb') as f:
             content = f.read()
             
-        # Pattern to match: #define MOVE_NAME number
-        pattern = r'#define\s+MOVE_(\w+)\s+(\d+)'
-        matches = re.findall(pattern, content)
+        # Matches are streamed into build_map rather than collected first
+        result = build_map(match.group(2, 3) for match in _DEFINE_RE.finditer(content)
+                           if match.group(1) == kind)
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(_dump_json({"key": cache_key, "map": result}, indent=False))
+        except OSError:
+            pass
+        return result
         
-        for move_name, move_id in matches:
-            # Convert MOVE_NAME to "Move Name"
-            formatted_name = move_name.replace('_', ' ').title()
-            # Handle special cases
-            formatted_name = formatted_name.replace('Hp', 'HP')
-            formatted_name = formatted_name.replace('Pp', 'PP')
-            formatted_name = formatted_name.replace('U Turn', 'U-turn')
-            formatted_name = formatted_name.replace('V Create', 'V-create')
-            
-            moves_map[int(move_id)] = formatted_name
+    @staticmethod
+    def _build_moves_map(matches: Iterator[Tuple[bytes, bytes]]) -> Dict[int, str]:
+        return {int(move_id): _format_move_name(move_name) for move_name, move_id in matches}
+    
+    @staticmethod
+    def _build_species_map(matches: Iterator[Tuple[bytes, bytes]]) -> Dict[int, str]:
+        return {int(species_id): _format_species_name(species_name) for species_name, species_id in matches}
+        
+    def parse_moves(self) -> Mapping[int, str]:
+        """Parse moves from constants/moves.h"""
+        moves_map = self._parse_header("include/constants/moves.h", b"MOVE", self._build_moves_map)
+        if moves_map is None:
+            return _EMPTY_MAP
             
         self.moves_data = moves_map
-        return moves_map
+        vars(self).pop('_moves_list', None)
+        return MappingProxyType(moves_map)
     
-    def parse_species(self) -> Dict[int, str]:
+    def parse_species(self) -> Mapping[int, str]:
         """Parse species from constants/species.h"""
-        species_file = self.project_root / "include/constants/species.h"
-        species_map = {}
-        
-        if not species_file.exists():
-            print(f"Warning: {species_file} not found")
-            return species_map
-            
-        with open(species_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Pattern to match: #define SPECIES_NAME number
-        pattern = r'#define\s+SPECIES_(\w+)\s+(\d+)'
-        matches = re.findall(pattern, content)
-        
-        for species_name, species_id in matches:
-            if species_name == "NONE":
-                continue
-                
-            # Convert SPECIES_NAME to "Species Name"
-            formatted_name = species_name.replace('_', ' ').title()
-            # Handle special cases
-            formatted_name = formatted_name.replace(' F', '♀')  # Female symbol
-            formatted_name = formatted_name.replace(' M', '♂')  # Male symbol
-            formatted_name = formatted_name.replace('Ho Oh', 'Ho-Oh')
-            formatted_name = formatted_name.replace('Mime Jr', 'Mime Jr.')
-            
-            species_map[int(species_id)] = formatted_name
+        species_map = self._parse_header("include/constants/species.h", b"SPECIES", self._build_species_map)
+        if species_map is None:
+            return _EMPTY_MAP
             
         self.species_data = species_map
-        return species_map
+        vars(self).pop('_species_list', None)
+        return MappingProxyType(species_map)
     
-    def parse_char_map(self) -> Dict[int, str]:
+    def parse_char_map(self) -> Mapping[int, str]:
         """Parse character map from charmap.txt"""
         charmap_file = self.project_root / "charmap.txt"
         char_map = {}
         
         if not charmap_file.exists():
             print(f"Warning: {charmap_file} not found")
-            return char_map
+            return _EMPTY_MAP
             
         try:
-            with open(charmap_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('//') or '=' not in line:
-                        continue
-                    
-                    # Parse lines like: 'A' = BB or PKMN = 53 54
-                    parts = line.split('=', 1)
-                    if len(parts) != 2:
-                        continue
-                    
-                    left = parts[0].strip()
-                    right = parts[1].strip()
-                    
-                    # Handle quoted characters like 'A' = BB
-                    if left.startswith("'") and left.endswith("'") and len(left) >= 3:
-                        char = left[1:-1]  # Extract character from quotes
-                        # Handle hex values (can be space-separated for multi-byte)
-                        hex_values = right.split()
-                        if hex_values:
-                            try:
-                                # Use first hex value for the character mapping
-                                hex_val = int(hex_values[0], 16)
-                                char_map[hex_val] = char
-                            except ValueError:
-                                continue
-                    
-                    # Handle special cases like PKMN, POKEBLOCK etc.
-                    elif not left.startswith("'"):
-                        # For now, just handle simple single-byte mappings
-                        hex_values = right.split()
-                        if len(hex_values) == 1:
+            with open(charmap_file, 'rb') as f:
+                # mmap cannot map an empty file
+                with (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                      if charmap_file.stat().st_size else contextlib.nullcontext(b"")) as content:
+                    for match in _CHARMAP_LINE_RE.finditer(content):
+                        quoted, token, hex_value = match.groups()
+                        # Use first hex value for the character mapping
+                        hex_val = _HEX_BYTE_VALUES.get(hex_value)
+                        if hex_val is None:
                             try:
-                                hex_val = int(hex_values[0], 16)
-                                # Map special tokens to readable strings
-                                if left == "PK":
-                                    char_map[hex_val] = "poke"
-                                elif left == "PKMN":
-                                    char_map[hex_val] = "POKE" 
-                                elif left == "LV":
-                                    char_map[hex_val] = "["
-                                elif left == "NBSP":
-                                    char_map[hex_val] = " "
-                                # Add more special mappings as needed
+                                hex_val = int(hex_value, 16)
                             except ValueError:
                                 continue
+                        if quoted:
+                            char_map[hex_val] = quoted.decode('utf-8')
+                        else:
+                            char_map[hex_val] = _CHARMAP_TOKENS[token]
             
             # Add terminator and fallback mappings
             char_map[0xFF] = " "  # Common terminator
@@ -150,89 +216,81 @@ class PokemonDataParser:
             }
         
         self.char_map_data = char_map
-        return char_map
+        vars(self).pop('_char_map_list', None)
+        return MappingProxyType(char_map)
     
-    def parse_natures(self) -> Dict[int, str]:
+    def parse_natures(self) -> Mapping[int, str]:
         """Parse natures - using standard Pokemon nature order"""
-        natures_map = {
-            0: "Hardy",
-            1: "Lonely", 
-            2: "Brave",
-            3: "Adamant",
-            4: "Naughty",
-            5: "Bold",
-            6: "Docile",
-            7: "Relaxed",
-            8: "Impish",
-            9: "Lax",
-            10: "Timid",
-            11: "Hasty",
-            12: "Serious",
-            13: "Jolly",
-            14: "Naive",
-            15: "Modest",
-            16: "Mild",
-            17: "Quiet",
-            18: "Bashful",
-            19: "Rash",
-            20: "Calm",
-            21: "Gentle",
-            22: "Sassy",
-            23: "Careful",
-            24: "Quirky"
-        }
+        natures_map = dict(enumerate(_NATURES))
         
         self.natures_data = natures_map
-        return natures_map
+        return MappingProxyType(natures_map)
+
+    def parse_all(self) -> ParsedData:
+        """Parse moves, species, character map and natures in one call"""
+        return ParsedData(
+            moves=self.parse_moves(),
+            species=self.parse_species(),
+            char_map=self.parse_char_map(),
+            natures=self.parse_natures(),
+        )
+
+    # Indexed-by-ID views of the *_data maps for the get_* lookups. They are
+    # built on first use (parsing if needed) and dropped by the parse_* methods
+    @cached_property
+    def _moves_list(self) -> List[Optional[str]]:
+        return _dense_table(self.moves_data or self.parse_moves())
+
+    @cached_property
+    def _species_list(self) -> List[Optional[str]]:
+        return _dense_table(self.species_data or self.parse_species())
+
+    @cached_property
+    def _char_map_list(self) -> List[Optional[str]]:
+        # Unmapped codes already hold the "?" fallback, so lookups need no check
+        return _dense_table(self.char_map_data or self.parse_char_map(), 256, "?")
 
     def get_move_name(self, move_id: int) -> str:
         """Get move name by ID"""
-        if not self.moves_data:
-            self.parse_moves()
-        return self.moves_data.get(move_id, f"Move {move_id}")
+        names = self._moves_list
+        name = names[move_id] if 0 <= move_id < len(names) else None
+        return name if name is not None else f"Move {move_id}"
     
     def get_species_name(self, species_id: int) -> str:
         """Get species name by ID"""
-        if not self.species_data:
-            self.parse_species()
-        return self.species_data.get(species_id, f"Species {species_id}")
+        names = self._species_list
+        name = names[species_id] if 0 <= species_id < len(names) else None
+        return name if name is not None else f"Species {species_id}"
     
     def get_char_map(self, char_code: int) -> str:
         """Get character by code"""
-        if not self.char_map_data:
-            self.parse_char_map()
-        return self.char_map_data.get(char_code, "?")
+        chars = self._char_map_list
+        return chars[char_code] if 0 <= char_code < len(chars) else "?"
     
     def get_nature_name(self, nature_id: int) -> str:
         """Get nature name by ID"""
-        if not self.natures_data:
-            self.parse_natures()
-        return self.natures_data.get(nature_id, f"Nature {nature_id}")
+        return _NATURES[nature_id] if 0 <= nature_id < len(_NATURES) else f"Nature {nature_id}"
 
-    def save_to_json(self, output_dir: str = "."):
-        """Save parsed data to JSON files"""
+    def save_to_json(self, output_dir: str = ".", indent: bool = True):
+        """Save parsed data to JSON files, compact unless indent is set"""
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
         # Save moves
         moves_file = output_path / "pokemon_moves.json"
-        with open(moves_file, 'w', encoding='utf-8') as f:
-            json.dump(self.moves_data, f, indent=2, ensure_ascii=False)
+        moves_file.write_bytes(_dump_json(self.moves_data, indent))
         
         # Save species
         species_file = output_path / "pokemon_species.json"
-        with open(species_file, 'w', encoding='utf-8') as f:
-            json.dump(self.species_data, f, indent=2, ensure_ascii=False)
+        species_file.write_bytes(_dump_json(self.species_data, indent))
         
         # Save character map
         charmap_file = output_path / "pokemon_charmap.json"
-        with open(charmap_file, 'w', encoding='utf-8') as f:
-            json.dump(self.char_map_data, f, indent=2, ensure_ascii=False)
+        charmap_file.write_bytes(_dump_json(self.char_map_data, indent))
             
         # Save natures
         natures_file = output_path / "pokemon_natures.json"
-        with open(natures_file, 'w', encoding='utf-8') as f:
-            json.dump(self.natures_data, f, indent=2, ensure_ascii=False)
+        natures_file.write_bytes(_dump_json(self.natures_data, indent))
             
         print(f"Saved {len(self.moves_data)} moves to {moves_file}")
         print(f"Saved {len(self.species_data)} species to {species_file}")
@@ -244,12 +302,10 @@ if __name__ == "__main__":
     parser = PokemonDataParser(".")
     
     # Parse data
-    moves = parser.parse_moves()
-    species = parser.parse_species()
-    char_map = parser.parse_char_map()
-    natures = parser.parse_natures()
+    parsed = parser.parse_all()
     
-    print(f"Parsed {len(moves)} moves, {len(species)} species, {len(char_map)} characters, and {len(natures)} natures")
+    print(f"Parsed {len(parsed.moves)} moves, {len(parsed.species)} species, "
+          f"{len(parsed.char_map)} characters, and {len(parsed.natures)} natures")
     
     # Test some lookups
     print(f"Move 446: {parser.get_move_name(446)}")  # Should be Stealth Rock